@@ -5,32 +5,34 @@ Path: backend/app/api/auth.py
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
+import threading
+import time
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.database import get_db
 from app.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, Token
+from app.services.auth_service import AuthService
 
 router = APIRouter()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return AuthService.verify_password(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Hash password"""
-    return pwd_context.hash(password)
+    return AuthService.get_password_hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -43,6 +45,56 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+# Short-lived email -> (expires_at, column values) cache so authenticated requests
+# don't query the users table every time. Only a snapshot of the columns is kept;
+# each hit builds a fresh detached User and merges it into the request's session
+# without a SELECT, so no cached object is ever shared between sessions.
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 10_000
+# Kept in least-recently-used order so a full cache only evicts the coldest entry
+_user_cache: "OrderedDict[str, tuple]" = OrderedDict()
+# Sync endpoints run in a threadpool, so reordering/evicting must not interleave
+_user_cache_lock = threading.Lock()
+_USER_COLUMNS = tuple(attr.key for attr in sa_inspect(User).column_attrs)
+
+def invalidate_cached_user(email: str):
+    """Drop a cached user; call after changing any of their columns (e.g. is_active)"""
+    with _user_cache_lock:
+        _user_cache.pop(email, None)
+
+def _get_cached_user(db: Session, email: str) -> Optional[User]:
+    """Return the user for `email`, serving repeat lookups from the TTL cache"""
+    now = time.monotonic()
+    with _user_cache_lock:
+        cached = _user_cache.get(email)
+        if cached and cached[0] > now:
+            _user_cache.move_to_end(email)
+        elif cached:
+            del _user_cache[email]
+            cached = None
+    if cached:
+        user = User(**cached[1])
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+    
+    user = db.query(User).filter(User.email == email).first()
+    if user is not None:
+        snapshot = {key: getattr(user, key) for key in _USER_COLUMNS}
+        with _user_cache_lock:
+            _user_cache.pop(email, None)
+            while len(_user_cache) >= USER_CACHE_MAX_SIZE:
+                _user_cache.popitem(last=False)
+            _user_cache[email] = (now + USER_CACHE_TTL_SECONDS, snapshot)
+    return user
+
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> dict:
+    """Decode and verify a JWT, caching the payload per token.
+
+    Expiry is only checked on the first decode, so callers must re-check `exp`.
+    """
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     """Get current authenticated user"""
     credentials_exception = HTTPException(
@@ -51,18 +103,20 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token(token)
         email: str = payload.get("sub")
-        if email is None:
+        if email is None or payload.get("exp", 0) <= time.time():
             raise credentials_exception
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
+    user = _get_cached_user(db, email)
     if user is None:
         raise credentials_exception
     return user
 
+# register/login are plain `def` endpoints on purpose: FastAPI runs them in its threadpool,
+# so bcrypt hashing and the sync DB session never block the event loop.
 @router.post("/register", response_model=UserResponse)
 def register(user: UserCreate, db: Session = Depends(get_db)):
     """Register new user"""
@@ -4,7 +4,8 @@ Path: backend/app/api/prices.py
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import func
 from typing import List, Optional
 from datetime import datetime, timedelta
 
@@ -15,6 +16,7 @@ from app.models.product import Product
 from app.models.store import Store
 from app.schemas.price import PriceResponse, PriceCreate, PriceTrend
 from app.api.auth import get_current_user
+from app.services.price_service import PriceService
 from app.tasks.scraping_tasks import trigger_scraping
 
 router = APIRouter()
@@ -31,7 +33,10 @@ def get_prices(
     is_available: Optional[bool] = None
 ):
     """Get current prices with filters"""
-    query = db.query(Price).join(Product).join(Store)
+    query = db.query(Price).join(Product).join(Store).options(
+        contains_eager(Price.product),
+        contains_eager(Price.store)
+    )
     
     if product_id:
         query = query.filter(Price.product_id == product_id)
@@ -43,40 +48,23 @@ def get_prices(
         query = query.filter(Price.is_available == is_available)
     
     # Get latest prices only (most recent for each product-store combination)
-    subquery = db.query(
-        Price.product_id,
-        Price.store_id,
-        db.func.max(Price.scraped_at).label('max_scraped_at')
-    ).group_by(Price.product_id, Price.store_id).subquery()
-    
-    query = query.join(
-        subquery,
-        db.and_(
-            Price.product_id == subquery.c.product_id,
-            Price.store_id == subquery.c.store_id,
-            Price.scraped_at == subquery.c.max_scraped_at
-        )
-    )
+    query = PriceService.filter_latest_prices(db, query)
     
     prices = query.offset(skip).limit(limit).all()
     
-    # Format response
+    # Format response; previous prices for every row come from one query
+    previous_prices = PriceService.get_previous_prices(db, prices)
     results = []
     for price in prices:
         # Calculate price change
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        previous_price = db.query(PriceHistory).filter(
-            PriceHistory.product_id == price.product_id,
-            PriceHistory.store_id == price.store_id,
-            PriceHistory.recorded_at < yesterday
-        ).order_by(PriceHistory.recorded_at.desc()).first()
+        previous_price = previous_prices.get((price.product_id, price.store_id))
         
         price_change = 0
         price_change_percent = 0
-        if previous_price:
-            price_change = price.price - previous_price.price
-            if previous_price.price > 0:
-                price_change_percent = (price_change / previous_price.price) * 100
+        if previous_price is not None:
+            price_change = price.price - previous_price
+            if previous_price > 0:
+                price_change_percent = (price_change / previous_price) * 100
         
         results.append({
             "id": price.id,
@@ -129,15 +117,33 @@ def get_price_trends(
     """Get price trends for a product"""
     since = datetime.utcnow() - timedelta(days=days)
     
-    query = db.query(PriceHistory).filter(
+    # Only the last record of each day per store is reported, so let the database
+    # pick it instead of shipping every scrape in the window
+    day = func.date(PriceHistory.recorded_at)
+    ranked = db.query(
+        PriceHistory.id,
+        func.row_number().over(
+            partition_by=(day, PriceHistory.store_id),
+            order_by=PriceHistory.recorded_at.desc()
+        ).label('rn')
+    ).filter(
         PriceHistory.product_id == product_id,
         PriceHistory.recorded_at >= since
     )
     
     if store_id:
-        query = query.filter(PriceHistory.store_id == store_id)
+        ranked = ranked.filter(PriceHistory.store_id == store_id)
     
-    history = query.order_by(PriceHistory.recorded_at).all()
+    ranked = ranked.subquery()
+    history = db.query(
+        PriceHistory.recorded_at,
+        PriceHistory.store_id,
+        PriceHistory.price,
+        PriceHistory.price_per_kg,
+        PriceHistory.is_available
+    ).join(
+        ranked, PriceHistory.id == ranked.c.id
+    ).filter(ranked.c.rn == 1).order_by(PriceHistory.recorded_at).all()
     
     # Group by date and store
     trends = {}
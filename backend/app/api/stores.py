@@ -5,7 +5,8 @@ Path: backend/app/api/stores.py
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import func, case
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from app.database import get_db
@@ -16,6 +17,15 @@ from app.api.auth import get_current_user
 
 router = APIRouter()
 
+def _count_store_prices(db: Session, store_ids: List[int]) -> Dict[int, Tuple[int, int]]:
+    """Return {store_id: (total_products, available_products)} from one grouped query"""
+    rows = db.query(
+        Price.store_id,
+        func.count(Price.id),
+        func.count(case((Price.is_available == True, 1)))
+    ).filter(Price.store_id.in_(store_ids)).group_by(Price.store_id).all()
+    return {store_id: (total, available) for store_id, total, available in rows}
+
 @router.get("/", response_model=List[StoreResponse])
 def get_stores(
     db: Session = Depends(get_db),
@@ -33,14 +43,10 @@ def get_stores(
     stores = query.offset(skip).limit(limit).all()
     
     # Add product counts
+    counts = _count_store_prices(db, [store.id for store in stores]) if stores else {}
     results = []
     for store in stores:
-        # Count total and available products
-        total_products = db.query(Price).filter(Price.store_id == store.id).count()
-        available_products = db.query(Price).filter(
-            Price.store_id == store.id,
-            Price.is_available == True
-        ).count()
+        total_products, available_products = counts.get(store.id, (0, 0))
         
         store_dict = {
             "id": store.id,
@@ -96,11 +102,7 @@ def get_store(
         raise HTTPException(status_code=404, detail="Store not found")
     
     # Add product counts
-    total_products = db.query(Price).filter(Price.store_id == store.id).count()
-    available_products = db.query(Price).filter(
-        Price.store_id == store.id,
-        Price.is_available == True
-    ).count()
+    total_products, available_products = _count_store_prices(db, [store.id]).get(store.id, (0, 0))
     
     store_dict = store.__dict__.copy()
     store_dict["total_products"] = total_products
@@ -3,7 +3,7 @@ Price model for current prices
 Path: backend/app/models/price.py
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -32,6 +32,16 @@ class Price(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    __table_args__ = (
+        # Latest price per product/store: DISTINCT ON ... ORDER BY scraped_at DESC,
+        # or max(scraped_at) on other databases
+        Index(
+            "ix_prices_product_store_scraped",
+            product_id, store_id, scraped_at.desc(),
+            postgresql_include=["price", "is_available"]
+        ),
+    )
+    
     # Relationships
     product = relationship("Product", backref="prices")
     store = relationship("Store", backref="prices")
\ No newline at end of file
@@ -3,13 +3,17 @@ Price history model for tracking price changes
 Path: backend/app/models/price_history.py
 """
 
-from sqlalchemy import Column, Integer, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
 class PriceHistory(Base):
     __tablename__ = "price_history"
+    __table_args__ = (
+        # Trend windows and "previous price" lookups filter on product/store, then time
+        Index("ix_price_history_product_store_recorded", "product_id", "store_id", "recorded_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
@@ -4,19 +4,90 @@ Handles common scraping functionality using Playwright
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Awaitable, Callable, Pattern, Tuple
 from datetime import datetime
 import logging
 import asyncio
 import re
+import time
 from decimal import Decimal
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, CDPSession, Page, Route, TimeoutError as PlaywrightTimeout
 import json
 
 logger = logging.getLogger(__name__)
 
+# Collects every product card on the page in a single round-trip. `fields` maps
+# an output key to [selector, mode] where mode is "text", "exists" or an
+# attribute name to read.
+EXTRACT_PRODUCTS_JS = """
+(cardSelector, fields) => Array.from(document.querySelectorAll(cardSelector), card => {
+    const out = {text: card.innerText};
+    for (const [key, [selector, mode]] of Object.entries(fields)) {
+        const el = card.querySelector(selector);
+        if (mode === 'exists') out[key] = el !== null;
+        else if (!el) out[key] = null;
+        else out[key] = mode === 'text' ? el.innerText : el.getAttribute(mode);
+    }
+    return out;
+})
+"""
+
+# Scrolls to the bottom up to `maxScrolls` times, waiting up to 3s each time for
+# the page to grow and stopping as soon as it doesn't.
+SCROLL_TO_END_JS = """
+async (maxScrolls) => {
+    for (let i = 0; i < maxScrolls; i++) {
+        const last = document.body.scrollHeight;
+        window.scrollTo(0, last);
+        const deadline = Date.now() + 3000;
+        while (document.body.scrollHeight <= last && Date.now() < deadline) {
+            await new Promise(resolve => setTimeout(resolve, 100));
+        }
+        if (document.body.scrollHeight <= last) break;
+    }
+}
+"""
+
+# Requests that never carry product data; aborting them cuts page weight and load time.
+# Stylesheets are kept so visibility-based waits keep working.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_URL_PARTS = (
+    "googletagmanager",
+    "google-analytics",
+    "doubleclick",
+    "hotjar",
+    "segment.io",
+    "facebook.net",
+)
+
+# Parsing helpers used for every product card, compiled once at import
+SIZE_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+PRICE_STRIP_RE = re.compile(r'[^\d.,]')
+ORGANIC_KEYWORDS = ('organic', 'bio', 'عضوي', 'اورجانيك')
+KG_UNITS = frozenset({'kg', 'كجم', 'كيلو'})
+GRAM_UNITS = frozenset({'g', 'جم', 'جرام', 'gram'})
+POUND_UNITS = frozenset({'lb', 'pound'})
+
+async def _block_unneeded_requests(route: Route):
+    """Abort media and third-party tracking requests, let everything else through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
 class ProductData:
     """Data class for scraped product information"""
+    # One is built for every product card on a page; slots drop the per-instance __dict__
+    __slots__ = (
+        "name", "brand", "price", "original_price", "pack_size", "pack_unit",
+        "price_per_kg", "is_available", "is_organic", "is_discounted", "category",
+        "image_url", "product_url", "scraped_at", "store_name",
+    )
+    
     def __init__(self):
         self.name: str = ""
         self.brand: Optional[str] = None
@@ -56,12 +127,30 @@ class ProductData:
 class BaseScraper(ABC):
     """Abstract base class for all store scrapers"""
     
+    # Number of pages scraping in parallel
+    max_concurrency: int = 4
+    
+    # One Playwright driver and one Chromium process per headless mode, shared by
+    # every scraper in the process; each scrape only opens (and closes) its own
+    # lightweight context
+    _playwright = None
+    _shared_browsers: Dict[bool, Browser] = {}
+    
     def __init__(self, store_name: str, base_url: str):
         self.store_name = store_name
         self.base_url = base_url
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._cdp_sessions: Dict[Page, CDPSession] = {}
+        self._api_client: Optional[httpx.AsyncClient] = None
         self.products_to_track = self._load_products_list()
+        # Flattened (lower-cased keyword, product) pairs in match priority order
+        self._product_keywords = [
+            (keyword.lower(), product)
+            for product in self.products_to_track
+            for keyword in product['keywords']
+        ]
         
     def _load_products_list(self) -> List[Dict]:
         """Load the list of products to track from configuration"""
@@ -94,73 +183,202 @@ class BaseScraper(ABC):
             {"name": "Romain Lettuce", "category": "B", "keywords": ["romaine", "romain lettuce", "خس روماني"]}
         ]
     
-    async def initialize_browser(self, headless: bool = True):
-        """Initialize Playwright browser"""
-        try:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
+    @classmethod
+    async def _get_shared_browser(cls, headless: bool = True) -> Browser:
+        """Launch the shared browser for this headless mode on first use, or relaunch it if it died"""
+        browser = BaseScraper._shared_browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            if BaseScraper._playwright is None:
+                BaseScraper._playwright = await async_playwright().start()
+            browser = await BaseScraper._playwright.chromium.launch(
                 headless=headless,
                 args=['--no-sandbox', '--disable-setuid-sandbox']
             )
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            self.page = await context.new_page()
+            BaseScraper._shared_browsers[headless] = browser
+        return browser
+    
+    @classmethod
+    async def shutdown_browser(cls):
+        """Close the shared browsers and stop Playwright"""
+        browsers = list(BaseScraper._shared_browsers.values())
+        BaseScraper._shared_browsers.clear()
+        for browser in browsers:
+            await browser.close()
+        if BaseScraper._playwright is not None:
+            await BaseScraper._playwright.stop()
+            BaseScraper._playwright = None
+    
+    async def initialize_browser(self, headless: bool = True):
+        """Initialize Playwright browser"""
+        try:
+            self.browser = await self._get_shared_browser(headless)
+            self.context = await self._new_context()
+            self.page = await self.context.new_page()
             logger.info(f"Browser initialized for {self.store_name}")
         except Exception as e:
             logger.error(f"Failed to initialize browser for {self.store_name}: {e}")
             raise
     
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with the scraper's default settings"""
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        )
+        await context.route("**/*", _block_unneeded_requests)
+        return context
+    
+    async def scrape_urls_concurrently(
+        self,
+        urls: List[str],
+        scrape_page: Callable[[Page, str], Awaitable[List[ProductData]]]
+    ) -> List[ProductData]:
+        """
+        Run scrape_page(page, url) for every URL in parallel.
+        Each call gets its own page in the scraper's context, so cookie consent
+        and any other cookies set on self.page apply to every page; at most
+        max_concurrency pages are loading at once.
+        """
+        slots = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(url: str) -> List[ProductData]:
+            async with slots:
+                page = None
+                start = time.monotonic_ns()
+                try:
+                    page = await self.context.new_page()
+                    return await scrape_page(page, url)
+                finally:
+                    logger.info(f"{self.store_name}: {url} took {(time.monotonic_ns() - start) / 1e6:.0f} ms")
+                    try:
+                        if page is not None:
+                            self._cdp_sessions.pop(page, None)
+                            await page.close()
+                    except Exception as e:
+                        logger.warning(f"Error closing page for {url} on {self.store_name}: {e}")
+        
+        results = await asyncio.gather(*(run(url) for url in urls), return_exceptions=True)
+        
+        products = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping {url} for {self.store_name}: {result}")
+                continue
+            products.extend(result)
+        return products
+    
+    def get_api_client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP/2 client for stores that expose their catalogue as JSON"""
+        if self._api_client is None:
+            self._api_client = httpx.AsyncClient(
+                http2=True,
+                timeout=15.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+            )
+        return self._api_client
+    
     async def close_browser(self):
-        """Close the browser"""
-        if self.browser:
-            await self.browser.close()
-            logger.info(f"Browser closed for {self.store_name}")
+        """Close this scraper's context; the shared browser stays up for the next scrape"""
+        self._cdp_sessions.clear()
+        if self._api_client is not None:
+            await self._api_client.aclose()
+            self._api_client = None
+        context = self.context
+        self.context = None
+        self.page = None
+        if context is not None:
+            await context.close()
+            logger.info(f"Browser context closed for {self.store_name}")
     
-    async def wait_for_page_load(self, timeout: int = 30000):
+    async def wait_for_page_load(self, timeout: int = 30000, page: Optional[Page] = None):
         """Wait for page to fully load"""
         try:
-            await self.page.wait_for_load_state('networkidle', timeout=timeout)
+            await (page or self.page).wait_for_load_state('networkidle', timeout=timeout)
         except PlaywrightTimeout:
             logger.warning(f"Page load timeout for {self.store_name}")
     
+    async def evaluate_cdp(self, expression: str, page: Optional[Page] = None) -> Any:
+        """
+        Evaluate a JS expression over a raw CDP session.
+        Skips Playwright's handle marshalling, which is cheaper for bulk DOM reads.
+        """
+        page = page or self.page
+        cdp = self._cdp_sessions.get(page)
+        if cdp is None:
+            cdp = await page.context.new_cdp_session(page)
+            self._cdp_sessions[page] = cdp
+        response = await cdp.send("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": True
+        })
+        if "exceptionDetails" in response:
+            raise RuntimeError(f"Evaluation failed: {response['exceptionDetails'].get('text')}")
+        return response["result"].get("value")
+    
+    async def extract_products_from_page(
+        self,
+        card_selector: str,
+        fields: Dict[str, List[str]],
+        page: Optional[Page] = None
+    ) -> List[Dict]:
+        """Read the raw fields of every product card on the current page in one call"""
+        expression = f"({EXTRACT_PRODUCTS_JS})({json.dumps(card_selector)}, {json.dumps(fields)})"
+        return await self.evaluate_cdp(expression, page) or []
+    
     def calculate_price_per_kg(self, price: Decimal, size: str, unit: str) -> Optional[Decimal]:
         """Calculate price per kilogram"""
         try:
             # Extract numeric value from size
-            size_match = re.search(r'(\d+(?:\.\d+)?)', size)
+            size_match = SIZE_NUMBER_RE.search(size)
             if not size_match:
                 return None
             
             size_value = Decimal(size_match.group(1))
             
-            # Convert to kg based on unit
-            if unit.lower() in ['kg', 'كجم', 'كيلو']:
+            # Convert to kg based on unit; pieces can't be expressed per kg
+            unit = unit.lower()
+            if unit in KG_UNITS:
                 return price / size_value
-            elif unit.lower() in ['g', 'جم', 'جرام', 'gram']:
+            elif unit in GRAM_UNITS:
                 return price / (size_value / 1000)
-            elif unit.lower() in ['lb', 'pound']:
+            elif unit in POUND_UNITS:
                 return price / (size_value * Decimal('0.453592'))
-            elif unit.lower() in ['piece', 'pcs', 'قطعة']:
-                # For pieces, we can't calculate per kg
-                return None
             else:
                 return None
         except Exception as e:
             logger.error(f"Error calculating price per kg: {e}")
             return None
     
+    def _parse_size(
+        self,
+        text: str,
+        patterns: Tuple[Pattern, ...],
+        unit_aliases: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, str]:
+        """Return (size, unit) from the first of the store's patterns that matches text"""
+        text_lower = text.lower()
+        for pattern in patterns:
+            match = pattern.search(text_lower)
+            if match:
+                unit = match.group(2)
+                if unit_aliases:
+                    unit = unit_aliases.get(unit, unit)
+                return match.group(1), unit
+        
+        return "", ""
+    
     def detect_organic(self, text: str) -> bool:
         """Detect if product is organic"""
-        organic_keywords = ['organic', 'bio', 'عضوي', 'اورجانيك']
-        return any(keyword in text.lower() for keyword in organic_keywords)
+        text = text.lower()
+        return any(keyword in text for keyword in ORGANIC_KEYWORDS)
     
     def clean_price(self, price_text: str) -> Decimal:
         """Extract and clean price from text"""
         try:
             # Remove currency symbols and text
-            price_text = re.sub(r'[^\d.,]', '', price_text)
+            price_text = PRICE_STRIP_RE.sub('', price_text)
             # Replace comma with dot for decimal
             price_text = price_text.replace(',', '.')
             # Remove multiple dots except the last one
@@ -175,12 +393,10 @@ class BaseScraper(ABC):
     def match_product(self, product_text: str) -> Optional[Dict]:
         """Match scraped product with tracked products list"""
         product_text_lower = product_text.lower()
-        
-        for product in self.products_to_track:
-            for keyword in product['keywords']:
-                if keyword.lower() in product_text_lower:
-                    return product
-        return None
+        return next(
+            (product for keyword, product in self._product_keywords if keyword in product_text_lower),
+            None
+        )
     
     @abstractmethod
     async def search_product(self, product_name: str) -> List[ProductData]:
@@ -194,6 +410,7 @@ class BaseScraper(ABC):
     
     async def scrape(self) -> List[ProductData]:
         """Main scraping method"""
+        start = time.monotonic_ns()
         try:
             await self.initialize_browser()
             logger.info(f"Starting scrape for {self.store_name}")
@@ -205,7 +422,8 @@ class BaseScraper(ABC):
             # Scrape all products
             products = await self.scrape_all_products()
             
-            logger.info(f"Scraped {len(products)} products from {self.store_name}")
+            duration = (time.monotonic_ns() - start) / 1e9
+            logger.info(f"Scraped {len(products)} products from {self.store_name} in {duration:.1f}s")
             return products
             
         except Exception as e:
@@ -228,27 +446,46 @@ class BaseScraper(ABC):
                 '[class*="consent-accept"]'
             ]
             
-            for selector in cookie_selectors:
-                try:
-                    button = await self.page.wait_for_selector(selector, timeout=3000)
-                    if button:
-                        await button.click()
-                        logger.info(f"Clicked cookie consent for {self.store_name}")
-                        break
-                except:
-                    continue
+            # Wait on all selectors at once so a missing popup costs one timeout, not one per selector
+            button = await self.page.wait_for_selector(', '.join(cookie_selectors), timeout=3000)
+            if button:
+                await button.click()
+                logger.info(f"Clicked cookie consent for {self.store_name}")
         except Exception as e:
             logger.debug(f"No cookie popup found for {self.store_name}")
     
-    async def scroll_to_load_more(self, max_scrolls: int = 5):
+    async def scroll_to_load_more(self, max_scrolls: int = 5, page: Optional[Page] = None):
         """Scroll page to load more products (for infinite scroll)"""
-        for i in range(max_scrolls):
-            await self.page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(2)  # Wait for content to load
+        # The whole scroll-until-stable loop runs in the browser, so it costs one round-trip
+        await (page or self.page).evaluate(SCROLL_TO_END_JS, max_scrolls)
             
     async def take_screenshot(self, filename: str = None):
         """Take a screenshot for debugging"""
         if not filename:
             filename = f"{self.store_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
         await self.page.screenshot(path=f"screenshots/{filename}")
-        logger.info(f"Screenshot saved: {filename}")
\ No newline at end of file
+        logger.info(f"Screenshot saved: {filename}")
+
+class ProductCardMixin(ABC):
+    """
+    For scrapers that read product cards in bulk with extract_products_from_page.
+    Subclasses declare PRODUCT_FIELDS and turn each card's raw fields into ProductData.
+    """
+    
+    # Fields read from each product card by extract_page_products
+    PRODUCT_FIELDS: Dict[str, List[str]] = {}
+    
+    async def extract_page_products(self, card_selector: str, page: Optional[Page] = None) -> List[ProductData]:
+        """Extract every product card on the page using PRODUCT_FIELDS"""
+        cards = await self.extract_products_from_page(card_selector, self.PRODUCT_FIELDS, page)
+        products = []
+        for fields in cards:
+            product = self._parse_product_fields(fields)
+            if product:
+                products.append(product)
+        return products
+    
+    @abstractmethod
+    def _parse_product_fields(self, fields: Dict) -> Optional[ProductData]:
+        """Build product data from the raw fields of a card"""
+        pass
@@ -6,14 +6,86 @@ Scrapes product data from https://gourmetegypt.com/
 from typing import List, Optional
 from decimal import Decimal
 import logging
+import re
 import asyncio
+import httpx
+from playwright.async_api import Page
 from app.scrapers.base_scraper import BaseScraper, ProductData
 
 logger = logging.getLogger(__name__)
 
+_SIZE_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)\s*(kg|كجم|كيلو)'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*(g|gm|gram|جم|جرام)'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*(lb|pound)'),
+    re.compile(r'(\d+)\s*(piece|pcs|قطعة)'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*(ml|liter|l)'),
+)
+
+# Arabic and long-form units mapped onto the names used elsewhere
+_UNIT_ALIASES = {
+    'كجم': 'kg',
+    'كيلو': 'kg',
+    'جم': 'g',
+    'جرام': 'g',
+    'gm': 'g',
+    'gram': 'g',
+    'قطعة': 'piece',
+    'pcs': 'piece',
+}
+
 class GourmetScraper(BaseScraper):
     """Scraper for Gourmet Egypt website"""
     
+    # Selectors are defined once per class rather than rebuilt for every product card
+    PRODUCT_SELECTORS = (
+        '.product-item',
+        '.product-card',
+        '[data-product-id]',
+        '.grid-item',
+        '.collection-product'
+    )
+    NAME_SELECTORS = (
+        '.product-title',
+        '.product-name',
+        'h3',
+        'h4',
+        '.title',
+        'a[href*="/products/"]'
+    )
+    PRICE_SELECTORS = (
+        '.product-price',
+        '.price',
+        '.money',
+        '[class*="price"]',
+        'span:has-text("EGP")',
+        'span:has-text("LE")'
+    )
+    ORIGINAL_PRICE_SELECTORS = (
+        '.compare-at-price',
+        '.was-price',
+        's',
+        'del',
+        '.original-price'
+    )
+    SIZE_SELECTORS = (
+        '.product-weight',
+        '.product-size',
+        '.weight',
+        '.size',
+        'small:has-text("kg")',
+        'small:has-text("g")',
+        'span:has-text("kg")',
+        'span:has-text("gram")'
+    )
+    OUT_OF_STOCK_SELECTORS = (
+        '.out-of-stock',
+        '.sold-out',
+        'button:has-text("Out of Stock")',
+        'button:has-text("Sold Out")',
+        '[class*="unavailable"]'
+    )
+    
     def __init__(self):
         super().__init__(
             store_name="Gourmet Egypt",
@@ -22,27 +94,34 @@ class GourmetScraper(BaseScraper):
     
     async def search_product(self, product_name: str) -> List[ProductData]:
         """Search for a specific product on Gourmet Egypt"""
-        products = []
-        
         try:
-            # Use the search functionality
-            search_url = f"{self.base_url}search?q={product_name.replace(' ', '+')}"
-            await self.page.goto(search_url, wait_until='domcontentloaded')
-            await self.wait_for_page_load()
-            
-            # Wait for products to load
-            await self.page.wait_for_selector('.product-item', timeout=10000)
-            
-            # Get all product cards
-            product_elements = await self.page.query_selector_all('.product-item')
-            
-            for element in product_elements[:10]:  # Limit to first 10 results
-                product = await self._extract_product_data(element)
-                if product and self.match_product(product.name):
-                    products.append(product)
-                    
+            return await self._search_page(self.page, self._search_url(product_name))
         except Exception as e:
             logger.error(f"Error searching for {product_name} on {self.store_name}: {e}")
+            return []
+    
+    def _search_url(self, product_name: str) -> str:
+        """Build the search URL for a product name"""
+        return f"{self.base_url}search?q={product_name.replace(' ', '+')}"
+    
+    async def _search_page(self, page: Page, search_url: str) -> List[ProductData]:
+        """Scrape tracked products from a single search results page"""
+        products = []
+        
+        # Use the search functionality
+        await page.goto(search_url, wait_until='domcontentloaded')
+        await self.wait_for_page_load(page=page)
+        
+        # Wait for products to load
+        await page.wait_for_selector('.product-item', timeout=10000)
+        
+        # Get all product cards
+        product_elements = await page.query_selector_all('.product-item')
+        
+        for element in product_elements[:10]:  # Limit to first 10 results
+            product = await self._extract_product_data(element)
+            if product and self.match_product(product.name):
+                products.append(product)
         
         return products
     
@@ -61,64 +140,120 @@ class GourmetScraper(BaseScraper):
                 '/collections/organic-produce'
             ]
             
-            for category_url in categories:
-                try:
-                    full_url = self.base_url.rstrip('/') + category_url
-                    logger.info(f"Scraping category: {full_url}")
-                    
-                    await self.page.goto(full_url, wait_until='domcontentloaded')
-                    await self.wait_for_page_load()
-                    
-                    # Scroll to load all products
-                    await self.scroll_to_load_more(max_scrolls=3)
-                    
-                    # Wait for products to load
-                    await self.page.wait_for_selector('.product-item, .product-card, [data-product-id]', timeout=10000)
-                    
-                    # Get all product elements (try multiple selectors)
-                    product_selectors = [
-                        '.product-item',
-                        '.product-card',
-                        '[data-product-id]',
-                        '.grid-item',
-                        '.collection-product'
-                    ]
-                    
-                    product_elements = []
-                    for selector in product_selectors:
-                        elements = await self.page.query_selector_all(selector)
-                        if elements:
-                            product_elements = elements
-                            logger.info(f"Found {len(elements)} products using selector: {selector}")
-                            break
-                    
-                    # Extract data from each product
-                    for element in product_elements:
-                        product = await self._extract_product_data(element)
-                        if product:
-                            # Check if it matches our tracked products
-                            matched = self.match_product(product.name)
-                            if matched:
-                                product.category = f"Category {matched['category']}"
-                                all_products.append(product)
-                                logger.info(f"Found tracked product: {product.name} - Price: {product.price}")
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping category {category_url}: {e}")
-                    continue
+            urls = [self.base_url.rstrip('/') + category_url for category_url in categories]
+            
+            # The storefront serves each collection as JSON; fetch them all over the
+            # shared HTTP/2 client and only render the pages whose JSON failed
+            results = await asyncio.gather(
+                *(self._scrape_category_json(url) for url in urls),
+                return_exceptions=True
+            )
+            fallback_urls = []
+            for url, result in zip(urls, results):
+                if isinstance(result, (httpx.HTTPError, ValueError, KeyError)):
+                    logger.info(f"JSON catalogue unavailable for {url}, falling back to page scrape: {result}")
+                    fallback_urls.append(url)
+                elif isinstance(result, Exception):
+                    logger.error(f"Error scraping {url} for {self.store_name}: {result}")
+                else:
+                    all_products.extend(result)
+            
+            if fallback_urls:
+                all_products.extend(await self.scrape_urls_concurrently(fallback_urls, self._scrape_category))
             
-            # Also search for specific products that might not be in categories
-            for product_info in self.products_to_track:
-                if not any(p.name == product_info['name'] for p in all_products):
-                    logger.info(f"Searching for missing product: {product_info['name']}")
-                    search_results = await self.search_product(product_info['name'])
-                    all_products.extend(search_results)
+            # Also search for specific products that might not be in categories;
+            # the searches are independent so they run in parallel
+            found_names = {p.name for p in all_products}
+            missing = [info['name'] for info in self.products_to_track if info['name'] not in found_names]
+            if missing:
+                logger.info(f"Searching for {len(missing)} missing products: {', '.join(missing)}")
+                search_urls = [self._search_url(name) for name in missing]
+                all_products.extend(await self.scrape_urls_concurrently(search_urls, self._search_page))
                     
         except Exception as e:
             logger.error(f"Error scraping all products from {self.store_name}: {e}")
         
         return all_products
     
+    async def _scrape_category(self, page: Page, full_url: str) -> List[ProductData]:
+        """Scrape tracked products from a single category page"""
+        logger.info(f"Scraping category page: {full_url}")
+        
+        products = []
+        await page.goto(full_url, wait_until='domcontentloaded')
+        await self.wait_for_page_load(page=page)
+        
+        # Scroll to load all products
+        await self.scroll_to_load_more(max_scrolls=3, page=page)
+        
+        # Wait for products to load
+        await page.wait_for_selector('.product-item, .product-card, [data-product-id]', timeout=10000)
+        
+        # Get all product elements (try multiple selectors)
+        product_elements = []
+        for selector in self.PRODUCT_SELECTORS:
+            elements = await page.query_selector_all(selector)
+            if elements:
+                product_elements = elements
+                logger.info(f"Found {len(elements)} products using selector: {selector}")
+                break
+        
+        # Extract data from each product
+        for element in product_elements:
+            product = await self._extract_product_data(element)
+            if product:
+                # Check if it matches our tracked products
+                matched = self.match_product(product.name)
+                if matched:
+                    product.category = f"Category {matched['category']}"
+                    products.append(product)
+                    logger.info(f"Found tracked product: {product.name} - Price: {product.price}")
+        
+        return products
+    
+    async def _scrape_category_json(self, full_url: str) -> List[ProductData]:
+        """Fetch a collection through the storefront's products.json endpoint"""
+        logger.info(f"Scraping category: {full_url}")
+        response = await self.get_api_client().get(f"{full_url}/products.json", params={'limit': 250})
+        response.raise_for_status()
+        
+        products = []
+        for item in response.json()['products']:
+            matched = self.match_product(item['title'])
+            if not matched or not item.get('variants'):
+                continue
+            
+            variant = item['variants'][0]
+            product = ProductData()
+            product.store_name = self.store_name
+            product.name = item['title'].strip()
+            product.price = self.clean_price(str(variant['price']))
+            if variant.get('compare_at_price'):
+                product.original_price = self.clean_price(str(variant['compare_at_price']))
+                product.is_discounted = product.original_price > product.price
+            
+            product.pack_size, product.pack_unit = self._parse_size(variant.get('title') or '', _SIZE_PATTERNS, _UNIT_ALIASES)
+            if not product.pack_size:
+                product.pack_size, product.pack_unit = self._parse_size(product.name, _SIZE_PATTERNS, _UNIT_ALIASES)
+            if product.pack_size and product.pack_unit:
+                product.price_per_kg = self.calculate_price_per_kg(
+                    product.price,
+                    product.pack_size,
+                    product.pack_unit
+                )
+            
+            product.is_organic = self.detect_organic(f"{product.name} {' '.join(item.get('tags') or [])}")
+            product.is_available = variant.get('available', True)
+            product.product_url = f"{self.base_url.rstrip('/')}/products/{item['handle']}"
+            if item.get('images'):
+                product.image_url = item['images'][0]['src']
+            
+            product.category = f"Category {matched['category']}"
+            products.append(product)
+            logger.info(f"Found tracked product: {product.name} - Price: {product.price}")
+        
+        return products
+    
     async def _extract_product_data(self, element) -> Optional[ProductData]:
         """Extract product data from a product element"""
         try:
@@ -126,16 +261,7 @@ class GourmetScraper(BaseScraper):
             product.store_name = self.store_name
             
             # Try multiple selectors for product name
-            name_selectors = [
-                '.product-title',
-                '.product-name',
-                'h3',
-                'h4',
-                '.title',
-                'a[href*="/products/"]'
-            ]
-            
-            for selector in name_selectors:
+            for selector in self.NAME_SELECTORS:
                 name_element = await element.query_selector(selector)
                 if name_element:
                     product.name = await name_element.inner_text()
@@ -146,16 +272,7 @@ class GourmetScraper(BaseScraper):
                 return None
             
             # Extract price
-            price_selectors = [
-                '.product-price',
-                '.price',
-                '.money',
-                '[class*="price"]',
-                'span:has-text("EGP")',
-                'span:has-text("LE")'
-            ]
-            
-            for selector in price_selectors:
+            for selector in self.PRICE_SELECTORS:
                 price_element = await element.query_selector(selector)
                 if price_element:
                     price_text = await price_element.inner_text()
@@ -164,15 +281,7 @@ class GourmetScraper(BaseScraper):
                         break
             
             # Check for original price (discounted items)
-            original_price_selectors = [
-                '.compare-at-price',
-                '.was-price',
-                's',
-                'del',
-                '.original-price'
-            ]
-            
-            for selector in original_price_selectors:
+            for selector in self.ORIGINAL_PRICE_SELECTORS:
                 original_price_element = await element.query_selector(selector)
                 if original_price_element:
                     original_price_text = await original_price_element.inner_text()
@@ -182,28 +291,17 @@ class GourmetScraper(BaseScraper):
                     break
             
             # Extract pack size and unit
-            size_selectors = [
-                '.product-weight',
-                '.product-size',
-                '.weight',
-                '.size',
-                'small:has-text("kg")',
-                'small:has-text("g")',
-                'span:has-text("kg")',
-                'span:has-text("gram")'
-            ]
-            
-            for selector in size_selectors:
+            for selector in self.SIZE_SELECTORS:
                 size_element = await element.query_selector(selector)
                 if size_element:
                     size_text = await size_element.inner_text()
-                    product.pack_size, product.pack_unit = self._parse_size(size_text)
+                    product.pack_size, product.pack_unit = self._parse_size(size_text, _SIZE_PATTERNS, _UNIT_ALIASES)
                     if product.pack_size:
                         break
             
             # If no size found in separate element, try to extract from name
             if not product.pack_size:
-                product.pack_size, product.pack_unit = self._parse_size(product.name)
+                product.pack_size, product.pack_unit = self._parse_size(product.name, _SIZE_PATTERNS, _UNIT_ALIASES)
             
             # Calculate price per kg
             if product.pack_size and product.pack_unit:
@@ -218,15 +316,7 @@ class GourmetScraper(BaseScraper):
             product.is_organic = self.detect_organic(full_text)
             
             # Check availability
-            out_of_stock_selectors = [
-                '.out-of-stock',
-                '.sold-out',
-                'button:has-text("Out of Stock")',
-                'button:has-text("Sold Out")',
-                '[class*="unavailable"]'
-            ]
-            
-            for selector in out_of_stock_selectors:
+            for selector in self.OUT_OF_STOCK_SELECTORS:
                 oos_element = await element.query_selector(selector)
                 if oos_element:
                     product.is_available = False
@@ -251,35 +341,3 @@ class GourmetScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Error extracting product data: {e}")
             return None
-    
-    def _parse_size(self, text: str) -> tuple:
-        """Parse size and unit from text"""
-        import re
-        
-        # Common patterns
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*(kg|كجم|كيلو)',
-            r'(\d+(?:\.\d+)?)\s*(g|gm|gram|جم|جرام)',
-            r'(\d+(?:\.\d+)?)\s*(lb|pound)',
-            r'(\d+)\s*(piece|pcs|قطعة)',
-            r'(\d+(?:\.\d+)?)\s*(ml|liter|l)',
-        ]
-        
-        text_lower = text.lower()
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                size = match.group(1)
-                unit = match.group(2)
-                
-                # Normalize units
-                if unit in ['كجم', 'كيلو']:
-                    unit = 'kg'
-                elif unit in ['جم', 'جرام', 'gm', 'gram']:
-                    unit = 'g'
-                elif unit in ['قطعة', 'piece', 'pcs']:
-                    unit = 'piece'
-                    
-                return size, unit
-        
-        return "", ""
\ No newline at end of file
@@ -4,17 +4,35 @@ Scrapes product data from https://www.metro-markets.com/
 Path: backend/app/scrapers/metro_scraper.py
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
 import logging
+import re
 import asyncio
-from app.scrapers.base_scraper import BaseScraper, ProductData
+from playwright.async_api import Page
+from app.scrapers.base_scraper import BaseScraper, ProductCardMixin, ProductData
 
 logger = logging.getLogger(__name__)
 
-class MetroScraper(BaseScraper):
+_SIZE_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)\s*(kg|كجم)'),
+    re.compile(r'(\d+(?:\.\d+)?)\s*(g|جم|gram)'),
+    re.compile(r'(\d+)\s*(piece|pcs|قطعة)'),
+)
+
+class MetroScraper(ProductCardMixin, BaseScraper):
     """Scraper for Metro Market website"""
     
+    PRODUCT_FIELDS = {
+        'name': ['.product-name, .product-title, h3, h4, [class*="title"]', 'text'],
+        'price': ['.price, .product-price, [class*="price"]:not([class*="old"])', 'text'],
+        'old_price': ['.old-price, .original-price, s, del', 'text'],
+        'size': ['.weight, .size, .pack-size, [class*="weight"]', 'text'],
+        'out_of_stock': ['.out-of-stock, .unavailable, [class*="out-of-stock"]', 'exists'],
+        'url': ['a[href*="/product"]', 'href'],
+        'image': ['img', 'src'],
+    }
+    
     def __init__(self):
         super().__init__(
             store_name="Metro",
@@ -34,12 +52,11 @@ class MetroScraper(BaseScraper):
             # Wait for products
             await self.page.wait_for_selector('.product-item, .product-card', timeout=10000)
             
-            # Get product elements
-            product_elements = await self.page.query_selector_all('.product-item, .product-card')
+            # Extract all product cards in one round-trip
+            page_products = await self.extract_page_products('.product-item, .product-card')
             
-            for element in product_elements[:10]:
-                product = await self._extract_product_data(element)
-                if product and self.match_product(product.name):
+            for product in page_products[:10]:
+                if self.match_product(product.name):
                     products.append(product)
                     
         except Exception as e:
@@ -61,78 +78,62 @@ class MetroScraper(BaseScraper):
                 '/organic'
             ]
             
-            for category_url in categories:
-                try:
-                    full_url = self.base_url.rstrip('/') + category_url
-                    logger.info(f"Scraping Metro category: {full_url}")
-                    
-                    await self.page.goto(full_url, wait_until='domcontentloaded')
-                    await self.wait_for_page_load()
-                    await self.scroll_to_load_more(max_scrolls=3)
-                    
-                    # Get product elements
-                    product_elements = await self.page.query_selector_all(
-                        '.product-item, .product-card, [data-product]'
-                    )
-                    
-                    for element in product_elements:
-                        product = await self._extract_product_data(element)
-                        if product:
-                            matched = self.match_product(product.name)
-                            if matched:
-                                product.category = f"Category {matched['category']}"
-                                all_products.append(product)
-                                logger.info(f"Found: {product.name} - {product.price} EGP")
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping Metro category {category_url}: {e}")
-                    continue
+            urls = [self.base_url.rstrip('/') + category_url for category_url in categories]
+            all_products.extend(await self.scrape_urls_concurrently(urls, self._scrape_category))
             
         except Exception as e:
             logger.error(f"Error scraping Metro: {e}")
         
         return all_products
     
-    async def _extract_product_data(self, element) -> Optional[ProductData]:
-        """Extract product data from element"""
+    async def _scrape_category(self, page: Page, full_url: str) -> List[ProductData]:
+        """Scrape tracked products from a single category page"""
+        products = []
+        logger.info(f"Scraping Metro category: {full_url}")
+        
+        await page.goto(full_url, wait_until='domcontentloaded')
+        await self.wait_for_page_load(page=page)
+        await self.scroll_to_load_more(max_scrolls=3, page=page)
+        
+        # Extract all product cards in one round-trip
+        page_products = await self.extract_page_products(
+            '.product-item, .product-card, [data-product]', page
+        )
+        
+        for product in page_products:
+            matched = self.match_product(product.name)
+            if matched:
+                product.category = f"Category {matched['category']}"
+                products.append(product)
+                logger.info(f"Found: {product.name} - {product.price} EGP")
+        
+        return products
+    
+    def _parse_product_fields(self, fields: Dict) -> Optional[ProductData]:
+        """Build product data from the raw fields of a product card"""
         try:
             product = ProductData()
             product.store_name = self.store_name
             
             # Extract name
-            name_element = await element.query_selector(
-                '.product-name, .product-title, h3, h4, [class*="title"]'
-            )
-            if name_element:
-                product.name = (await name_element.inner_text()).strip()
+            if fields.get('name'):
+                product.name = fields['name'].strip()
             
             if not product.name:
                 return None
             
             # Extract price
-            price_element = await element.query_selector(
-                '.price, .product-price, [class*="price"]:not([class*="old"])'
-            )
-            if price_element:
-                price_text = await price_element.inner_text()
-                product.price = self.clean_price(price_text)
+            if fields.get('price'):
+                product.price = self.clean_price(fields['price'])
             
             # Check for discount
-            old_price_element = await element.query_selector(
-                '.old-price, .original-price, s, del'
-            )
-            if old_price_element:
-                old_price_text = await old_price_element.inner_text()
-                product.original_price = self.clean_price(old_price_text)
+            if fields.get('old_price'):
+                product.original_price = self.clean_price(fields['old_price'])
                 product.is_discounted = True
             
             # Extract size
-            size_element = await element.query_selector(
-                '.weight, .size, .pack-size, [class*="weight"]'
-            )
-            if size_element:
-                size_text = await size_element.inner_text()
-                product.pack_size, product.pack_unit = self._parse_size(size_text)
+            if fields.get('size'):
+                product.pack_size, product.pack_unit = self._parse_size(fields['size'], _SIZE_PATTERNS)
             
             # Calculate price per kg
             if product.pack_size and product.pack_unit:
@@ -141,46 +142,21 @@ class MetroScraper(BaseScraper):
                 )
             
             # Check organic
-            full_text = await element.inner_text()
-            product.is_organic = self.detect_organic(full_text)
+            product.is_organic = self.detect_organic(fields.get('text') or '')
             
             # Check availability
-            out_of_stock = await element.query_selector(
-                '.out-of-stock, .unavailable, [class*="out-of-stock"]'
-            )
-            product.is_available = out_of_stock is None
+            product.is_available = not fields.get('out_of_stock')
             
             # Get URL
-            link = await element.query_selector('a[href*="/product"]')
-            if link:
-                href = await link.get_attribute('href')
+            href = fields.get('url')
+            if href:
                 product.product_url = self.base_url + href if href.startswith('/') else href
             
             # Get image
-            img = await element.query_selector('img')
-            if img:
-                product.image_url = await img.get_attribute('src')
+            product.image_url = fields.get('image')
             
             return product
             
         except Exception as e:
             logger.error(f"Error extracting Metro product data: {e}")
             return None
-    
-    def _parse_size(self, text: str) -> tuple:
-        """Parse size and unit from text"""
-        import re
-        
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*(kg|كجم)',
-            r'(\d+(?:\.\d+)?)\s*(g|جم|gram)',
-            r'(\d+)\s*(piece|pcs|قطعة)',
-        ]
-        
-        text_lower = text.lower()
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                return match.group(1), match.group(2)
-        
-        return "", ""
\ No newline at end of file
@@ -5,17 +5,32 @@ Scrapes product data from https://www.rabbitmart.com/
 Path: backend/app/scrapers/rabbit_scraper.py
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
 import logging
+import re
 import asyncio
-from app.scrapers.base_scraper import BaseScraper, ProductData
+from playwright.async_api import Page
+from app.scrapers.base_scraper import BaseScraper, ProductCardMixin, ProductData
 
 logger = logging.getLogger(__name__)
 
-class RabbitScraper(BaseScraper):
+_SIZE_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)\s*(kg|g|gm|kilo|gram)'),
+    re.compile(r'(\d+)\s*(piece|pcs)'),
+)
+
+class RabbitScraper(ProductCardMixin, BaseScraper):
     """Scraper for Rabbit Mart website"""
 
+    PRODUCT_FIELDS = {
+        'name': ['.product-name', 'text'],
+        'discounted_price': ['.price-after-discount', 'text'],
+        'price': ['.product-price', 'text'],
+        'size': ['.product-weight', 'text'],
+        'out_of_stock': ['.out-of-stock-label', 'exists'],
+    }
+
     def __init__(self):
         super().__init__(
             store_name="Rabbit",
@@ -31,11 +46,10 @@ class RabbitScraper(BaseScraper):
             await self.wait_for_page_load()
 
             await self.page.wait_for_selector('.product-grid .product-item', timeout=10000)
-            product_elements = await self.page.query_selector_all('.product-grid .product-item')
+            page_products = await self.extract_page_products('.product-grid .product-item')
 
-            for element in product_elements[:10]:
-                product = await self._extract_product_data(element)
-                if product and self.match_product(product.name):
+            for product in page_products[:10]:
+                if self.match_product(product.name):
                     products.append(product)
         except Exception as e:
             logger.error(f"Error searching Rabbit Mart: {e}")
@@ -49,71 +63,53 @@ class RabbitScraper(BaseScraper):
             'organic-food'
         ]
         try:
-            for category_url in categories:
-                full_url = self.base_url + category_url
-                await self.page.goto(full_url, wait_until='domcontentloaded')
-                await self.wait_for_page_load()
-                await self.scroll_to_load_more(max_scrolls=5)
-
-                product_elements = await self.page.query_selector_all('.product-grid .product-item')
-                for element in product_elements:
-                    product = await self._extract_product_data(element)
-                    if product and self.match_product(product.name):
-                        all_products.append(product)
+            urls = [self.base_url + category_url for category_url in categories]
+            all_products.extend(await self.scrape_urls_concurrently(urls, self._scrape_category))
         except Exception as e:
             logger.error(f"Error scraping Rabbit Mart: {e}")
 
         return all_products
 
-    async def _extract_product_data(self, element) -> Optional[ProductData]:
-        """Extract product data from element"""
+    async def _scrape_category(self, page: Page, full_url: str) -> List[ProductData]:
+        """Scrape tracked products from a single category page"""
+        products = []
+        await page.goto(full_url, wait_until='domcontentloaded')
+        await self.wait_for_page_load(page=page)
+        await self.scroll_to_load_more(max_scrolls=5, page=page)
+
+        page_products = await self.extract_page_products('.product-grid .product-item', page)
+        for product in page_products:
+            if self.match_product(product.name):
+                products.append(product)
+        return products
+
+    def _parse_product_fields(self, fields: Dict) -> Optional[ProductData]:
+        """Build product data from the raw fields of a product card"""
         try:
             product = ProductData()
             product.store_name = self.store_name
 
-            name_element = await element.query_selector('.product-name')
-            if name_element:
-                product.name = (await name_element.inner_text()).strip()
+            if fields.get('name'):
+                product.name = fields['name'].strip()
 
             if not product.name:
                 return None
 
-            price_element = await element.query_selector('.price-after-discount')
-            if not price_element:
-                price_element = await element.query_selector('.product-price')
-
-            if price_element:
-                price_text = await price_element.inner_text()
+            price_text = fields.get('discounted_price') or fields.get('price')
+            if price_text:
                 product.price = self.clean_price(price_text)
 
-            size_element = await element.query_selector('.product-weight')
-            if size_element:
-                size_text = await size_element.inner_text()
-                product.pack_size, product.pack_unit = self._parse_size(size_text)
+            if fields.get('size'):
+                product.pack_size, product.pack_unit = self._parse_size(fields['size'], _SIZE_PATTERNS)
 
             if product.pack_size and product.pack_unit:
                 product.price_per_kg = self.calculate_price_per_kg(
                     product.price, product.pack_size, product.pack_unit
                 )
 
-            out_of_stock_element = await element.query_selector('.out-of-stock-label')
-            product.is_available = out_of_stock_element is None
+            product.is_available = not fields.get('out_of_stock')
             
             return product
         except Exception as e:
             logger.error(f"Error extracting Rabbit Mart product data: {e}")
             return None
-
-    def _parse_size(self, text: str) -> tuple:
-        """Parse size and unit from text"""
-        import re
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*(kg|g|gm|kilo|gram)',
-            r'(\d+)\s*(piece|pcs)',
-        ]
-        text_lower = text.lower()
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                return match.group(1), match.group(2)
-        return "", ""
\ No newline at end of file
@@ -223,10 +223,14 @@ Provide analysis as JSON with:
         
         try:
             # Get recent price data from database
+            from sqlalchemy.orm import contains_eager, selectinload
             from app.models.price import Price
             from app.models.product import Product
             
-            query = db.query(Price).join(Product)
+            query = db.query(Price).join(Product).options(
+                contains_eager(Price.product),
+                selectinload(Price.store)
+            )
             if category:
                 query = query.filter(Product.category == category)
             
@@ -351,16 +355,14 @@ Return as JSON with:
         if len(historical_prices) < 2:
             return {"predicted_prices": [historical_prices[-1]] * days_ahead}
         
-        # Simple moving average
-        recent_avg = np.mean(historical_prices[-7:])
-        trend = (historical_prices[-1] - historical_prices[-7]) / 7 if len(historical_prices) >= 7 else 0
-        
-        predictions = []
-        for i in range(days_ahead):
-            predictions.append(round(recent_avg + (trend * i), 2))
+        # Simple moving average, projected along the weekly trend in one vectorized pass
+        prices = np.asarray(historical_prices, dtype=np.float64)
+        recent_avg = prices[-7:].mean()
+        trend = (prices[-1] - prices[-7]) / 7 if prices.size >= 7 else 0.0
+        predictions = np.round(recent_avg + trend * np.arange(days_ahead), 2)
         
         return {
-            "predicted_prices": predictions,
+            "predicted_prices": predictions.tolist(),
             "confidence": "low",
             "factors": ["Simple statistical projection"],
             "risk": "High uncertainty without AI analysis"
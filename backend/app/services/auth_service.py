@@ -6,7 +6,7 @@ Path: backend/app/services/auth_service.py
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -14,7 +14,10 @@ from app.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt is called directly; passlib's scheme dispatch added overhead to every login.
+# Passwords are truncated to bcrypt's 72-byte limit, as passlib did.
+BCRYPT_ROUNDS = 12
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 class AuthService:
     """Authentication service for user management"""
@@ -22,12 +25,21 @@ class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return pwd_context.verify(plain_password, hashed_password)
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], hashed_password.encode()
+            )
+        except ValueError:
+            # Malformed hash
+            return False
     
     @staticmethod
     def get_password_hash(password: str) -> str:
         """Hash a password"""
-        return pwd_context.hash(password)
+        hashed = bcrypt.hashpw(
+            password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+        )
+        return hashed.decode()
     
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -111,4 +123,5 @@ class AuthService:
     @staticmethod
     def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        return db.query(User).filter(User.id == user_id).first()
\ No newline at end of file
+        # Session.get checks the identity map before issuing a query
+        return db.get(User, user_id)
\ No newline at end of file
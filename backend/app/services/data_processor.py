@@ -8,6 +8,12 @@ from decimal import Decimal
 import re
 from app.scrapers.base_scraper import ProductData
 
+# Compiled once; these run for every scraped item
+WHITESPACE_RE = re.compile(r'\s+')
+PACK_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(kg|g|gm|kilo|gram)', re.IGNORECASE)
+GRAM_UNITS = frozenset({'g', 'gm', 'gram'})
+KG_UNITS = frozenset({'kg', 'kilo'})
+
 class DataProcessor:
     """
     Processes raw scraped data before saving to the database.
@@ -57,7 +63,7 @@ class DataProcessor:
         """
         Remove extra whitespace and special characters from text.
         """
-        return re.sub(r'\s+', ' ', text).strip()
+        return WHITESPACE_RE.sub(' ', text).strip()
 
     def _normalize_pack_size(self, name: str, pack_size: str, pack_unit: str) -> tuple[str, str]:
         """
@@ -65,7 +71,7 @@ class DataProcessor:
         """
         # Attempt to extract from name if not present
         if not pack_size:
-            match = re.search(r'(\d+(?:\.\d+)?)\s*(kg|g|gm|kilo|gram)', name, re.IGNORECASE)
+            match = PACK_SIZE_RE.search(name)
             if match:
                 pack_size = match.group(1)
                 pack_unit = match.group(2)
@@ -73,9 +79,9 @@ class DataProcessor:
         # Normalize units
         if pack_unit:
             unit_lower = pack_unit.lower()
-            if unit_lower in ['g', 'gm', 'gram']:
+            if unit_lower in GRAM_UNITS:
                 pack_unit = 'g'
-            elif unit_lower in ['kg', 'kilo']:
+            elif unit_lower in KG_UNITS:
                 pack_unit = 'kg'
 
         return pack_size, pack_unit
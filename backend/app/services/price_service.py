@@ -5,17 +5,36 @@ Path: backend/app/services/price_service.py
 
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, contains_eager, selectinload
+from sqlalchemy import func, and_, tuple_
+import json
 import logging
+import redis
 
 from app.models.price import Price
 from app.models.price_history import PriceHistory
 from app.models.product import Product
 from app.models.store import Store
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Window for "price change since yesterday"
+PRICE_CHANGE_WINDOW = timedelta(days=1)
+
+# Current-price listings are cached in Redis for a short time. Keys embed a version
+# number that is bumped after every scrape, so new prices are never served stale.
+PRICE_CACHE_TTL_SECONDS = 120
+PRICE_CACHE_VERSION_KEY = "prices:version"
+_redis_client: Optional[redis.Redis] = None
+
+def _get_redis() -> redis.Redis:
+    """Lazily create the Redis client used for price caching"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5)
+    return _redis_client
+
 class PriceService:
     """Service for managing price data and analytics"""
     
@@ -31,8 +50,26 @@ class PriceService:
     ) -> List[Dict]:
         """Get current prices with filters"""
         
-        # Base query
-        query = db.query(Price).join(Product).join(Store)
+        # Serve repeat requests from Redis; the cache is best-effort and never fails a request
+        cache_key = None
+        try:
+            client = _get_redis()
+            version = int(client.get(PRICE_CACHE_VERSION_KEY) or 0)
+            cache_key = (
+                f"prices:current:{version}:{product_id}:{store_id}:{category}:"
+                f"{is_available}:{skip}:{limit}"
+            )
+            cached = client.get(cache_key)
+            if cached is not None:
+                return json.loads(cached)
+        except redis.RedisError as e:
+            logger.warning(f"Price cache unavailable: {e}")
+        
+        # Base query; product and store come back in the same rows instead of lazy loads
+        query = db.query(Price).join(Product).join(Store).options(
+            contains_eager(Price.product),
+            contains_eager(Price.store)
+        )
         
         # Apply filters
         if product_id:
@@ -45,13 +82,53 @@ class PriceService:
             query = query.filter(Price.is_available == is_available)
         
         # Get latest prices only (most recent for each product-store combination)
+        query = PriceService.filter_latest_prices(db, query)
+        
+        # Execute query
+        prices = query.offset(skip).limit(limit).all()
+        
+        # Format results with price changes
+        previous_prices = PriceService.get_previous_prices(db, prices)
+        results = []
+        for price in prices:
+            previous_price = previous_prices.get((price.product_id, price.store_id))
+            results.append(PriceService._format_price_with_change(price, previous_price))
+        
+        if cache_key is not None:
+            try:
+                _get_redis().setex(cache_key, PRICE_CACHE_TTL_SECONDS, json.dumps(results))
+            except redis.RedisError as e:
+                logger.warning(f"Could not cache prices: {e}")
+        
+        return results
+    
+    @staticmethod
+    def invalidate_price_cache():
+        """Make cached price listings stale, e.g. after new prices are saved"""
+        try:
+            _get_redis().incr(PRICE_CACHE_VERSION_KEY)
+        except redis.RedisError as e:
+            logger.warning(f"Could not invalidate price cache: {e}")
+    
+    @staticmethod
+    def filter_latest_prices(db: Session, query):
+        """Restrict a Price query to the most recent row for each (product_id, store_id)"""
+        if db.bind.dialect.name == 'postgresql':
+            # DISTINCT ON reads the prices once in (product, store, scraped_at DESC) order
+            latest_ids = db.query(Price.id).distinct(
+                Price.product_id, Price.store_id
+            ).order_by(
+                Price.product_id, Price.store_id, Price.scraped_at.desc()
+            ).subquery()
+            return query.filter(Price.id.in_(db.query(latest_ids.c.id)))
+        
         subquery = db.query(
             Price.product_id,
             Price.store_id,
             func.max(Price.scraped_at).label('max_scraped_at')
         ).group_by(Price.product_id, Price.store_id).subquery()
         
-        query = query.join(
+        return query.join(
             subquery,
             and_(
                 Price.product_id == subquery.c.product_id,
@@ -59,36 +136,52 @@ class PriceService:
                 Price.scraped_at == subquery.c.max_scraped_at
             )
         )
-        
-        # Execute query
-        prices = query.offset(skip).limit(limit).all()
-        
-        # Format results with price changes
-        results = []
-        for price in prices:
-            price_data = PriceService._format_price_with_change(db, price)
-            results.append(price_data)
-        
-        return results
     
     @staticmethod
-    def _format_price_with_change(db: Session, price: Price) -> Dict:
-        """Format price with change information"""
-        
-        # Calculate price change from yesterday
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        previous_price = db.query(PriceHistory).filter(
-            PriceHistory.product_id == price.product_id,
-            PriceHistory.store_id == price.store_id,
+    def get_previous_prices(db: Session, prices: List[Price]) -> Dict[tuple, float]:
+        """
+        Latest recorded price from before yesterday for each (product_id, store_id)
+        in `prices`, fetched in one query instead of one per row
+        """
+        pairs = {(price.product_id, price.store_id) for price in prices}
+        if not pairs:
+            return {}
+        
+        yesterday = datetime.utcnow() - PRICE_CHANGE_WINDOW
+        latest = db.query(
+            PriceHistory.product_id,
+            PriceHistory.store_id,
+            func.max(PriceHistory.recorded_at).label('max_recorded_at')
+        ).filter(
+            tuple_(PriceHistory.product_id, PriceHistory.store_id).in_(pairs),
             PriceHistory.recorded_at < yesterday
-        ).order_by(PriceHistory.recorded_at.desc()).first()
+        ).group_by(PriceHistory.product_id, PriceHistory.store_id).subquery()
+        
+        rows = db.query(
+            PriceHistory.product_id,
+            PriceHistory.store_id,
+            PriceHistory.price
+        ).join(
+            latest,
+            and_(
+                PriceHistory.product_id == latest.c.product_id,
+                PriceHistory.store_id == latest.c.store_id,
+                PriceHistory.recorded_at == latest.c.max_recorded_at
+            )
+        ).all()
+        
+        return {(product_id, store_id): price for product_id, store_id, price in rows}
+    
+    @staticmethod
+    def _format_price_with_change(price: Price, previous_price: Optional[float]) -> Dict:
+        """Format price with change information relative to `previous_price`"""
         
         price_change = 0
         price_change_percent = 0
         
-        if previous_price and previous_price.price > 0:
-            price_change = price.price - previous_price.price
-            price_change_percent = (price_change / previous_price.price) * 100
+        if previous_price and previous_price > 0:
+            price_change = price.price - previous_price
+            price_change_percent = (price_change / previous_price) * 100
         
         return {
             "id": price.id,
@@ -144,6 +237,7 @@ class PriceService:
         db.add(history_entry)
         db.commit()
         db.refresh(new_price)
+        PriceService.invalidate_price_cache()
         
         return new_price
     
@@ -158,7 +252,14 @@ class PriceService:
         
         since = datetime.utcnow() - timedelta(days=days)
         
-        query = db.query(PriceHistory).filter(
+        # Only the columns used below; plain rows skip ORM object hydration
+        query = db.query(
+            PriceHistory.recorded_at,
+            PriceHistory.store_id,
+            PriceHistory.price,
+            PriceHistory.price_per_kg,
+            PriceHistory.is_available
+        ).filter(
             PriceHistory.product_id == product_id,
             PriceHistory.recorded_at >= since
         )
@@ -190,14 +291,21 @@ class PriceService:
         """Get best prices for a product across all stores"""
         
         # Get current prices for the product from all stores
-        prices = db.query(Price).filter(
+        # Every row shares one product and a handful of stores, so load each once
+        # with a primary-key IN query instead of repeating them on every joined row
+        prices = db.query(Price).options(
+            selectinload(Price.product),
+            selectinload(Price.store)
+        ).filter(
             Price.product_id == product_id,
             Price.is_available == True
         ).order_by(Price.price).all()
         
+        previous_prices = PriceService.get_previous_prices(db, prices)
         results = []
         for price in prices:
-            results.append(PriceService._format_price_with_change(db, price))
+            previous_price = previous_prices.get((price.product_id, price.store_id))
+            results.append(PriceService._format_price_with_change(price, previous_price))
         
         return results
     
@@ -212,7 +320,13 @@ class PriceService:
         
         since = datetime.utcnow() - timedelta(days=days)
         
-        query = db.query(PriceHistory).filter(
+        # All four statistics come from a single aggregate scan
+        query = db.query(
+            func.avg(PriceHistory.price),
+            func.min(PriceHistory.price),
+            func.max(PriceHistory.price),
+            func.count(PriceHistory.id)
+        ).filter(
             PriceHistory.recorded_at >= since
         )
         
@@ -221,20 +335,10 @@ class PriceService:
         if store_id:
             query = query.filter(PriceHistory.store_id == store_id)
         
-        # Calculate statistics
-        avg_price = db.query(func.avg(PriceHistory.price)).filter(
-            PriceHistory.recorded_at >= since
-        ).scalar() or 0
-        
-        min_price = db.query(func.min(PriceHistory.price)).filter(
-            PriceHistory.recorded_at >= since
-        ).scalar() or 0
-        
-        max_price = db.query(func.max(PriceHistory.price)).filter(
-            PriceHistory.recorded_at >= since
-        ).scalar() or 0
-        
-        total_records = query.count()
+        avg_price, min_price, max_price, total_records = query.one()
+        avg_price = avg_price or 0
+        min_price = min_price or 0
+        max_price = max_price or 0
         
         return {
             "average_price": round(avg_price, 2),
@@ -3,19 +3,23 @@ Celery tasks for web scraping
 Path: backend/app/tasks/scraping_tasks.py
 """
 
-from celery import shared_task
+from celery import group, shared_task
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown, worker_shutdown
 from datetime import datetime
 import logging
 import asyncio
 from typing import List
+from sqlalchemy import insert
 
 from app.database import SessionLocal
 from app.models.store import Store
 from app.models.product import Product
 from app.models.price import Price
 from app.models.price_history import PriceHistory
+from app.services.price_service import PriceService
 from app.scrapers import (
+    BaseScraper,
     GourmetScraper,
     RDNAScraper,
     MetroScraper,
@@ -40,6 +44,32 @@ SCRAPER_MAP = {
     "BreadfastScraper": BreadfastScraper
 }
 
+# Event loop reused by every scrape in this worker process. The shared Playwright
+# browser is bound to the loop it was started on, so it can't be recreated per task.
+_scrape_loop = None
+
+def _get_scrape_loop():
+    """Return the worker's long-lived scraping event loop"""
+    global _scrape_loop
+    if _scrape_loop is None or _scrape_loop.is_closed():
+        _scrape_loop = asyncio.new_event_loop()
+    return _scrape_loop
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_scrape_loop(**kwargs):
+    """Close the shared browser and Playwright driver, then the scraping loop"""
+    global _scrape_loop
+    if _scrape_loop is None or _scrape_loop.is_closed():
+        return
+    try:
+        _scrape_loop.run_until_complete(BaseScraper.shutdown_browser())
+    except Exception as e:
+        logger.warning(f"Error shutting down scraping browser: {e}")
+    finally:
+        _scrape_loop.close()
+        _scrape_loop = None
+
 def setup_periodic_tasks():
     """Setup periodic scraping tasks"""
     from app.tasks.celery_app import celery_app
@@ -76,20 +106,19 @@ def scrape_store_task(store_id: int):
         
         # Run scraper
         scraper = scraper_class()
-        loop = asyncio.new_event_loop()
+        loop = _get_scrape_loop()
         asyncio.set_event_loop(loop)
         products_data = loop.run_until_complete(scraper.scrape())
-        loop.close()
         
-        # Save scraped data
-        save_scraped_data(db, store_id, products_data)
-        
-        # Update store status
+        # Update store status; save_scraped_data commits it together with the prices
+        store_name = store.name
         store.status = "online"
         store.last_scraped = datetime.utcnow()
-        db.commit()
         
-        logger.info(f"Successfully scraped {len(products_data)} products from {store.name}")
+        # Save scraped data
+        save_scraped_data(db, store_id, products_data)
+        
+        logger.info(f"Successfully scraped {len(products_data)} products from {store_name}")
         
     except Exception as e:
         logger.error(f"Error scraping store {store_id}: {e}")
@@ -102,84 +131,97 @@ def scrape_store_task(store_id: int):
 @shared_task
 def scrape_all_stores_task():
     """Scrape all active stores"""
-    db = SessionLocal()
     try:
-        stores = db.query(Store).filter(Store.is_active == True).all()
+        with SessionLocal() as db:
+            count = trigger_scraping(db)
         
-        for store in stores:
-            scrape_store_task.delay(store.id)
-        
-        logger.info(f"Initiated scraping for {len(stores)} stores")
+        logger.info(f"Initiated scraping for {count} stores")
         
     except Exception as e:
         logger.error(f"Error initiating scraping: {e}")
-    finally:
-        db.close()
+
+def _product_key(name: str) -> str:
+    """Case- and whitespace-insensitive key used to match scraped names to products"""
+    return ' '.join(name.lower().split())
 
 def save_scraped_data(db, store_id: int, products_data: List):
     """Save scraped product data to database"""
     try:
-        # Get all products
+        # Load every product once and match scraped items against this index
         products = db.query(Product).all()
-        product_map = {p.name.lower(): p for p in products}
+        product_map = {_product_key(p.name): p for p in products}
         
+        # Overlapping categories can return the same listing twice; keep the first of each
+        unique_data = {}
         for data in products_data:
+            unique_data.setdefault((_product_key(data.name), data.price), data)
+        
+        matched = []
+        for (key, _), data in unique_data.items():
             # Find matching product
-            product = product_map.get(data.name.lower())
+            product = product_map.get(key)
             if not product:
-                # Create new product if not exists
+                # Create new product if not exists; index it so repeats in this batch reuse it
                 product = Product(
                     name=data.name,
                     category=data.category or "A",
                     is_organic=data.is_organic
                 )
                 db.add(product)
-                db.flush()
-            
-            # Check if price already exists
-            existing_price = db.query(Price).filter(
-                Price.product_id == product.id,
-                Price.store_id == store_id
-            ).order_by(Price.scraped_at.desc()).first()
-            
-            # Save new price
-            new_price = Price(
-                product_id=product.id,
-                store_id=store_id,
-                price=float(data.price),
-                original_price=float(data.original_price) if data.original_price else None,
-                price_per_kg=float(data.price_per_kg) if data.price_per_kg else None,
-                pack_size=data.pack_size,
-                pack_unit=data.pack_unit,
-                is_available=data.is_available,
-                is_discounted=data.is_discounted,
-                product_url=data.product_url,
-                image_url=data.image_url
-            )
-            db.add(new_price)
-            
-            # Add to price history
-            history = PriceHistory(
-                product_id=product.id,
-                store_id=store_id,
-                price=float(data.price),
-                price_per_kg=float(data.price_per_kg) if data.price_per_kg else None,
-                is_available=data.is_available
-            )
-            db.add(history)
+                product_map[key] = product
+            matched.append((product, data))
+        
+        if matched:
+            _insert_price_rows(db, store_id, matched)
         
         db.commit()
+        PriceService.invalidate_price_cache()
         
     except Exception as e:
         logger.error(f"Error saving scraped data: {e}")
         db.rollback()
         raise
 
+def _insert_price_rows(db, store_id: int, matched: List):
+    """Write Price and PriceHistory rows for (product, scraped data) pairs"""
+    # One flush assigns ids to any new products, then prices and history go in
+    # as two executemany INSERTs instead of one INSERT per ORM object
+    db.flush()
+    price_rows = []
+    history_rows = []
+    for product, data in matched:
+        price = float(data.price)
+        price_per_kg = float(data.price_per_kg) if data.price_per_kg else None
+        price_rows.append({
+            "product_id": product.id,
+            "store_id": store_id,
+            "price": price,
+            "original_price": float(data.original_price) if data.original_price else None,
+            "price_per_kg": price_per_kg,
+            "pack_size": data.pack_size,
+            "pack_unit": data.pack_unit,
+            "is_available": data.is_available,
+            "is_discounted": data.is_discounted,
+            "product_url": data.product_url,
+            "image_url": data.image_url
+        })
+        history_rows.append({
+            "product_id": product.id,
+            "store_id": store_id,
+            "price": price,
+            "price_per_kg": price_per_kg,
+            "is_available": data.is_available
+        })
+    
+    db.execute(insert(Price), price_rows)
+    db.execute(insert(PriceHistory), history_rows)
+
 def trigger_scraping(db):
     """Trigger scraping for all stores (called from API)"""
-    stores = db.query(Store).filter(Store.is_active == True).all()
+    store_ids = [store_id for (store_id,) in db.query(Store.id).filter(Store.is_active == True)]
     
-    for store in stores:
-        scrape_store_task.delay(store.id)
+    # Dispatch every store as one group so workers pick them up in parallel
+    if store_ids:
+        group(scrape_store_task.s(store_id) for store_id in store_ids).apply_async()
     
-    return len(stores)
\ No newline at end of file
+    return len(store_ids)
\ No newline at end of file
@@ -3,8 +3,56 @@ Category Classifier Utility
 Path: backend/app/utils/category_classifier.py
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Pattern
+from functools import lru_cache
 import re
+import unicodedata
+
+# The same product names come back from every store on every scrape
+CLASSIFY_CACHE_SIZE = 65536
+
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "A": [
+        "cucumber", "خيار", "tomato", "طماطم", "cherry tomato", 
+        "طماطم كرزية", "capsicum mix", "pepper mix", "red capsicum", 
+        "red pepper", "فلفل أحمر", "yellow capsicum", "yellow pepper", 
+        "فلفل أصفر", "chili", "hot pepper", "فلفل حار", "arugula", 
+        "rocket", "جرجير", "parsley", "بقدونس", "coriander", "cilantro", 
+        "كزبرة", "mint", "نعناع", "tuscan kale", "lacinato kale", 
+        "dinosaur kale", "basil", "italian basil", "ريحان"
+    ],
+    "B": [
+        "colored cherry", "rainbow tomatoes", "green capsicum", 
+        "green pepper", "فلفل أخضر", "italian arugula", "wild arugula", 
+        "chives", "ثوم معمر", "curly kale", "kale", "batavia", 
+        "batavia lettuce", "iceberg", "iceberg lettuce", "خس آيسبرغ", 
+        "oak leaf", "oakleaf lettuce", "romaine", "romain lettuce", 
+        "خس روماني"
+    ]
+}
+
+# One whole-word alternation per category, compiled once at import and shared
+# by every classifier instance
+CATEGORY_PATTERNS: Dict[str, Pattern] = {
+    category: re.compile(
+        r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b'
+    )
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def _classify_text(text_to_search: str) -> str:
+    """Classify normalized, lowercased text; memoized across all classifier instances"""
+    # Check for Category B keywords first
+    if CATEGORY_PATTERNS["B"].search(text_to_search):
+        return "B"
+
+    # Check for Category A keywords
+    if CATEGORY_PATTERNS["A"].search(text_to_search):
+        return "A"
+
+    # Default to Category A if no keywords are found
+    return "A"
 
 class CategoryClassifier:
     """
@@ -12,25 +60,8 @@ class CategoryClassifier:
     """
 
     def __init__(self):
-        self.category_keywords: Dict[str, List[str]] = {
-            "A": [
-                "cucumber", "خيار", "tomato", "طماطم", "cherry tomato", 
-                "طماطم كرزية", "capsicum mix", "pepper mix", "red capsicum", 
-                "red pepper", "فلفل أحمر", "yellow capsicum", "yellow pepper", 
-                "فلفل أصفر", "chili", "hot pepper", "فلفل حار", "arugula", 
-                "rocket", "جرجير", "parsley", "بقدونس", "coriander", "cilantro", 
-                "كزبرة", "mint", "نعناع", "tuscan kale", "lacinato kale", 
-                "dinosaur kale", "basil", "italian basil", "ريحان"
-            ],
-            "B": [
-                "colored cherry", "rainbow tomatoes", "green capsicum", 
-                "green pepper", "فلفل أخضر", "italian arugula", "wild arugula", 
-                "chives", "ثوم معمر", "curly kale", "kale", "batavia", 
-                "batavia lettuce", "iceberg", "iceberg lettuce", "خس آيسبرغ", 
-                "oak leaf", "oakleaf lettuce", "romaine", "romain lettuce", 
-                "خس روماني"
-            ]
-        }
+        # Keyword tables, patterns and cached results are shared by every instance
+        self.category_keywords = CATEGORY_KEYWORDS
 
     def classify(self, product_name: str, description: Optional[str] = None) -> str:
         """
@@ -43,19 +74,39 @@ class CategoryClassifier:
         Returns:
             str: The classified category ('A' or 'B'). Defaults to 'A'.
         """
-        text_to_search = product_name.lower()
+        text_to_search = product_name.strip()
         if description:
-            text_to_search += " " + description.lower()
-
-        # Check for Category B keywords first
-        for keyword in self.category_keywords["B"]:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text_to_search):
-                return "B"
-        
-        # Check for Category A keywords
-        for keyword in self.category_keywords["A"]:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text_to_search):
-                return "A"
-        
-        # Default to Category A if no keywords are found
-        return "A"
\ No newline at end of file
+            text_to_search += " " + description.strip()
+
+        # Storefronts sometimes send Arabic presentation forms or full-width Latin;
+        # NFKC folds them onto the same code points as the keyword table
+        return _classify_text(unicodedata.normalize("NFKC", text_to_search).lower())
+
+    def classify_products(
+        self,
+        product_names: List[str],
+        descriptions: Optional[List[Optional[str]]] = None
+    ) -> List[str]:
+        """
+        Classify a batch of products, e.g. everything returned by one scrape.
+
+        Args:
+            product_names (List[str]): The names of the products.
+            descriptions (Optional[List[Optional[str]]]): Descriptions aligned with
+                `product_names`, if available.
+
+        Returns:
+            List[str]: The category ('A' or 'B') of each product, in input order.
+        """
+        if descriptions is None:
+            descriptions = [None] * len(product_names)
+
+        # Duplicate names within a batch are classified once
+        classified: Dict[tuple, str] = {}
+        categories = []
+        for product_name, description in zip(product_names, descriptions):
+            key = (product_name, description)
+            if key not in classified:
+                classified[key] = self.classify(product_name, description)
+            categories.append(classified[key])
+        return categories
@@ -3,12 +3,43 @@ Logging configuration
 Path: backend/app/utils/logger.py
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 
+# Background listeners that write queued records to disk, one per configured logger
+_file_listeners = {}
+
+def _stop_listener(listener: QueueListener):
+    """Flush a listener's queue, stop its thread and close its file handlers"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+def _stop_file_listeners():
+    """Flush and stop every background file listener"""
+    for listener in _file_listeners.values():
+        _stop_listener(listener)
+    _file_listeners.clear()
+
+def _restart_file_listeners():
+    """
+    Give a forked child its own listener threads. Threads don't survive fork, so
+    without this a prefork worker's queued records would never reach the file.
+    """
+    for name, listener in _file_listeners.items():
+        restarted = QueueListener(listener.queue, *listener.handlers, respect_handler_level=True)
+        restarted.start()
+        _file_listeners[name] = restarted
+
+atexit.register(_stop_file_listeners)
+os.register_at_fork(after_in_child=_restart_file_listeners)
+
 def setup_logger(
     name: str = "crops_tracker",
     log_level: str = "INFO",
@@ -32,6 +63,9 @@ def setup_logger(
     
     # Remove existing handlers
     logger.handlers = []
+    previous_listener = _file_listeners.pop(name, None)
+    if previous_listener:
+        _stop_listener(previous_listener)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -59,7 +93,14 @@ def setup_logger(
         )
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Callers only enqueue the record; a listener thread does the disk write
+        # and rotation so a slow disk never stalls a request or scrape
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _file_listeners[name] = listener
+        logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
@@ -35,6 +35,31 @@ class PriceCalculator:
         'milliliter': 0.001,
     }
     
+    # Patterns compiled once at import rather than looked up on every call
+    SIZE_SANITIZE_RE = re.compile(r'[^\d.]')
+    PRICE_SANITIZE_RE = re.compile(r'[^\d.,]')
+    SIZE_PATTERNS = (
+        re.compile(r'(\d+(?:\.\d+)?)\s*(kg|كجم|كيلو)'),
+        re.compile(r'(\d+(?:\.\d+)?)\s*(g|gm|gram|جم|جرام)'),
+        re.compile(r'(\d+(?:\.\d+)?)\s*(lb|pound)'),
+        re.compile(r'(\d+(?:\.\d+)?)\s*(l|liter|لتر)'),
+        re.compile(r'(\d+(?:\.\d+)?)\s*(ml|milliliter|مل)'),
+        re.compile(r'(\d+)\s*(piece|pcs|قطعة)'),
+        re.compile(r'(\d+)\s*(pack|bundle)'),
+    )
+    UNIT_MAPPINGS = {
+        'كجم': 'kg',
+        'كيلو': 'kg',
+        'جم': 'g',
+        'جرام': 'g',
+        'gm': 'g',
+        'gram': 'g',
+        'لتر': 'l',
+        'مل': 'ml',
+        'قطعة': 'piece',
+        'pcs': 'piece',
+    }
+    
     @staticmethod
     def calculate_price_per_kg(
         price: float,
@@ -54,7 +79,7 @@ class PriceCalculator:
         """
         try:
             # Clean and convert size to float
-            size_value = float(re.sub(r'[^\d.]', '', str(size)))
+            size_value = float(PriceCalculator.SIZE_SANITIZE_RE.sub('', str(size)))
             
             # Get conversion factor
             unit_lower = unit.lower().strip()
@@ -90,40 +115,16 @@ class PriceCalculator:
         Returns:
             Tuple of (size, unit) or ("", "") if not found
         """
-        # Common patterns for size extraction
-        patterns = [
-            r'(\d+(?:\.\d+)?)\s*(kg|كجم|كيلو)',
-            r'(\d+(?:\.\d+)?)\s*(g|gm|gram|جم|جرام)',
-            r'(\d+(?:\.\d+)?)\s*(lb|pound)',
-            r'(\d+(?:\.\d+)?)\s*(l|liter|لتر)',
-            r'(\d+(?:\.\d+)?)\s*(ml|milliliter|مل)',
-            r'(\d+)\s*(piece|pcs|قطعة)',
-            r'(\d+)\s*(pack|bundle)',
-        ]
-        
         text_lower = text.lower()
         
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in PriceCalculator.SIZE_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 size = match.group(1)
                 unit = match.group(2)
                 
                 # Normalize units
-                unit_mappings = {
-                    'كجم': 'kg',
-                    'كيلو': 'kg',
-                    'جم': 'g',
-                    'جرام': 'g',
-                    'gm': 'g',
-                    'gram': 'g',
-                    'لتر': 'l',
-                    'مل': 'ml',
-                    'قطعة': 'piece',
-                    'pcs': 'piece',
-                }
-                
-                unit = unit_mappings.get(unit, unit)
+                unit = PriceCalculator.UNIT_MAPPINGS.get(unit, unit)
                 return size, unit
         
         return "", ""
@@ -164,7 +165,7 @@ class PriceCalculator:
         """
         try:
             # Remove common currency symbols and text
-            price_text = re.sub(r'[^\d.,]', '', price_text)
+            price_text = PriceCalculator.PRICE_SANITIZE_RE.sub('', price_text)
             
             # Handle different decimal separators
             # Replace comma with dot for decimal
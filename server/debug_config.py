@@ -1,111 +1,153 @@
 #!/usr/bin/env python3
 
+import argparse
 import os
+from importlib.metadata import PackageNotFoundError, version
 from typing import Optional
 
 # Simple debug script to test Pydantic configuration
-print("=== Pydantic Configuration Debug ===")
-
-# Check Pydantic version
-try:
-    import pydantic
-    print(f"Pydantic version: {pydantic.VERSION}")
-except Exception as e:
-    print(f"Pydantic import error: {e}")
-
-# Try different approaches
-approaches = [
-    "BaseModel with extra='allow'",
-    "BaseSettings v1 style", 
-    "BaseSettings v2 style",
-    "Manual dict loading"
-]
 
-print(f"\nTesting {len(approaches)} approaches...\n")
+# Test with your actual key
+TEST_DATA = {
+    "ANTHROPIC_API_KEY": "sk-ant-api03--test-key",
+    "DEBUG": True,
+    "UNKNOWN_KEY": "should be allowed"
+}
+
+# Approaches skipped by --simple
+SIMPLE_SKIP = {"BaseSettings v1 style"}
+
+# Environment values read as true, matching what pydantic accepts for bool fields
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _preview(key: Optional[str]) -> str:
+    """Shorten an API key for display so the full secret never hits the console"""
+    return f"{key[:20]}..." if key else "NOT_FOUND"
 
-# Approach 1: BaseModel with extra='allow'
-print("1. Testing BaseModel with extra='allow':")
-try:
+
+def _try_basemodel():
     from pydantic import BaseModel
-    
+
     class TestConfig1(BaseModel):
         ANTHROPIC_API_KEY: Optional[str] = None
         DEBUG: bool = False
-        
+
         class Config:
             extra = "allow"
-    
-    # Test with your actual key
-    test_data = {
-        "ANTHROPIC_API_KEY": "sk-ant-api03--test-key",
-        "DEBUG": True,
-        "UNKNOWN_KEY": "should be allowed"
-    }
-    
-    config1 = TestConfig1(**test_data)
-    print(f"✅ SUCCESS: {config1.ANTHROPIC_API_KEY[:20]}...")
-    
-except Exception as e:
-    print(f"❌ FAILED: {e}")
-
-print()
-
-# Approach 2: BaseSettings v1 style
-print("2. Testing BaseSettings v1 style:")
-try:
+
+    config1 = TestConfig1(**TEST_DATA)
+    return _preview(config1.ANTHROPIC_API_KEY)
+
+
+def _try_basesettings_v1():
     from pydantic import BaseSettings
-    
+
     class TestConfig2(BaseSettings):
         ANTHROPIC_API_KEY: Optional[str] = None
         DEBUG: bool = False
-        
+
         class Config:
             extra = "allow"
             case_sensitive = True
-    
+
     config2 = TestConfig2()
-    print(f"✅ SUCCESS: {getattr(config2, 'ANTHROPIC_API_KEY', 'NOT_FOUND')}")
-    
-except Exception as e:
-    print(f"❌ FAILED: {e}")
+    return _preview(getattr(config2, 'ANTHROPIC_API_KEY', None))
 
-print()
 
-# Approach 3: BaseSettings v2 style  
-print("3. Testing BaseSettings v2 style:")
-try:
+def _try_basesettings_v2():
     from pydantic_settings import BaseSettings
     from pydantic import ConfigDict
-    
+
     class TestConfig3(BaseSettings):
         model_config = ConfigDict(extra="allow", case_sensitive=True)
-        
+
         ANTHROPIC_API_KEY: Optional[str] = None
         DEBUG: bool = False
-    
+
     config3 = TestConfig3()
-    print(f"✅ SUCCESS: {getattr(config3, 'ANTHROPIC_API_KEY', 'NOT_FOUND')}")
-    
-except Exception as e:
-    print(f"❌ FAILED: {e}")
+    return _preview(getattr(config3, 'ANTHROPIC_API_KEY', None))
 
-print()
 
-# Approach 4: Manual dict loading
-print("4. Testing manual dict loading:")
-try:
+def _try_manual_dict():
     from dotenv import load_dotenv
     load_dotenv()
-    
+
     class TestConfig4:
         def __init__(self):
             self.ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
-            self.DEBUG = os.getenv('DEBUG', 'false').lower() == 'true'
-    
+            self.DEBUG = os.getenv('DEBUG', '').strip().lower() in TRUTHY_VALUES
+
     config4 = TestConfig4()
-    print(f"✅ SUCCESS: {config4.ANTHROPIC_API_KEY[:20] if config4.ANTHROPIC_API_KEY else 'NOT_FOUND'}...")
-    
-except Exception as e:
-    print(f"❌ FAILED: {e}")
+    return _preview(config4.ANTHROPIC_API_KEY)
+
+
+# Try different approaches: (name, function, pydantic major version it needs)
+APPROACHES = [
+    ("BaseModel with extra='allow'", _try_basemodel, None),
+    ("BaseSettings v1 style", _try_basesettings_v1, 1),
+    ("BaseSettings v2 style", _try_basesettings_v2, 2),
+    ("manual dict loading", _try_manual_dict, None),
+]
+
+
+def _print_pydantic_version() -> Optional[str]:
+    # Read the installed version from package metadata; pydantic itself is only
+    # imported by the approaches that need it
+    try:
+        pydantic_version = version('pydantic')
+    except PackageNotFoundError as e:
+        print(f"Pydantic import error: {e}")
+        return None
+
+    print(f"Pydantic version: {pydantic_version}")
+    return pydantic_version
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test Pydantic configuration approaches")
+    parser.add_argument(
+        "--first-success",
+        action="store_true",
+        help="stop after the first approach that works"
+    )
+    parser.add_argument(
+        "--simple",
+        action="store_true",
+        help="skip the pydantic v1 BaseSettings approach"
+    )
+    args = parser.parse_args()
+    approaches = [
+        (name, approach, required_major) for name, approach, required_major in APPROACHES
+        if not (args.simple and name in SIMPLE_SKIP)
+    ]
+
+    print("=== Pydantic Configuration Debug ===")
+
+    pydantic_version = _print_pydantic_version()
+    pydantic_major = int(pydantic_version.split('.')[0]) if pydantic_version else None
+
+    print(f"\nTesting {len(approaches)} approaches...\n")
+
+    for number, (name, approach, required_major) in enumerate(approaches, start=1):
+        print(f"{number}. Testing {name}:")
+        # An approach written for the other pydantic major version can only fail
+        if required_major and pydantic_major and required_major != pydantic_major:
+            print(f"⏭  SKIPPED: needs pydantic v{required_major}\n")
+            continue
+
+        try:
+            result = approach()
+        except Exception as e:
+            print(f"❌ FAILED: {e}\n")
+            continue
+
+        print(f"✅ SUCCESS: {result}\n")
+        if args.first_success:
+            break
+
+    print("=== End Debug ===")
+
 
-print("\n=== End Debug ===")
\ No newline at end of file
+if __name__ == "__main__":
+    main()